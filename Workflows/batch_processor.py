@@ -4,6 +4,7 @@ Automated batch conversion with advanced features
 """
 
 import asyncio
+import os
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -268,24 +269,54 @@ def find_files(
     Returns:
         List of file paths
     """
-    if recursive:
-        pattern = '**/*.*'
-    else:
-        pattern = '*.*'
-    
     files = []
-    for file in directory.glob(pattern):
-        if file.is_file():
-            if extensions is None:
+    for file in _scan_files(directory, recursive):
+        if extensions is None:
+            files.append(file)
+        else:
+            ext = get_file_extension(file)
+            if ext in extensions:
                 files.append(file)
-            else:
-                ext = get_file_extension(file)
-                if ext in extensions:
-                    files.append(file)
     
     return files
 
 
+def _scan_files(directory: Path, recursive: bool = False):
+    """
+    Yield regular files in directory using os.scandir
+    
+    DirEntry caches the file type from the directory read, so unlike
+    Path.glob/iterdir no extra stat call is made per entry. Names without
+    an extension are skipped, matching the '*.*' glob. Subdirectories that
+    cannot be read are skipped, as the glob did.
+    
+    Args:
+        directory: Directory to scan
+        recursive: Descend into subdirectories
+        
+    Yields:
+        File paths
+    """
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            it = os.scandir(current)
+        except PermissionError:
+            if current is directory:
+                raise
+            logger.warning(f"Skipping unreadable directory: {current}")
+            continue
+        
+        with it:
+            for entry in it:
+                if entry.is_file():
+                    if '.' in entry.name:
+                        yield Path(entry.path)
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
+
 def batch_convert_directory(
     input_dir: str | Path,
     output_dir: str | Path,
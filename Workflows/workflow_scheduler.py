@@ -3,18 +3,26 @@ Workflow Scheduler
 Schedule and automate conversion workflows
 """
 
-import json
+import os
+import tempfile
+import threading
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from utils.logger import get_logger
+from utils.helpers import load_json_file, save_json_file
 from .batch_processor import BatchProcessor, find_files
 
 logger = get_logger(__name__)
 
 
 class WorkflowScheduler:
-    """Schedule and manage conversion workflows"""
+    """
+    Schedule and manage conversion workflows
+    
+    Read-modify-write updates of the workflows file are serialized by an
+    internal lock, so one instance can be shared between threads.
+    """
     
     def __init__(self, workflows_dir: Optional[Path] = None):
         if workflows_dir is None:
@@ -24,6 +32,7 @@ class WorkflowScheduler:
         self.workflows_dir = Path(workflows_dir)
         self.workflows_file = self.workflows_dir / "workflows.json"
         self.processor = BatchProcessor()
+        self._lock = threading.RLock()
     
     def create_workflow(
         self,
@@ -64,9 +73,10 @@ class WorkflowScheduler:
         }
         
         # Save workflow
-        workflows = self.load_workflows()
-        workflows[name] = workflow
-        self.save_workflows(workflows)
+        with self._lock:
+            workflows = self.load_workflows()
+            workflows[name] = workflow
+            self.save_workflows(workflows)
         
         logger.info(f"Created workflow: {name}")
         return workflow
@@ -118,11 +128,14 @@ class WorkflowScheduler:
             workflow.get('quality', 'high')
         )
         
-        # Update workflow stats
-        workflow['last_run'] = datetime.now().isoformat()
-        workflow['run_count'] = workflow.get('run_count', 0) + 1
-        workflows[name] = workflow
-        self.save_workflows(workflows)
+        # Update workflow stats against the latest file contents
+        with self._lock:
+            workflows = self.load_workflows()
+            if name in workflows:
+                workflow = workflows[name]
+                workflow['last_run'] = datetime.now().isoformat()
+                workflow['run_count'] = workflow.get('run_count', 0) + 1
+                self.save_workflows(workflows)
         
         logger.info(
             f"Workflow completed: {name} - "
@@ -187,13 +200,14 @@ class WorkflowScheduler:
         Returns:
             True if deleted
         """
-        workflows = self.load_workflows()
-        
-        if name in workflows:
-            del workflows[name]
-            self.save_workflows(workflows)
-            logger.info(f"Deleted workflow: {name}")
-            return True
+        with self._lock:
+            workflows = self.load_workflows()
+            
+            if name in workflows:
+                del workflows[name]
+                self.save_workflows(workflows)
+                logger.info(f"Deleted workflow: {name}")
+                return True
         
         return False
     
@@ -207,13 +221,14 @@ class WorkflowScheduler:
     
     def _set_workflow_enabled(self, name: str, enabled: bool) -> bool:
         """Set workflow enabled status"""
-        workflows = self.load_workflows()
-        
-        if name in workflows:
-            workflows[name]['enabled'] = enabled
-            self.save_workflows(workflows)
-            logger.info(f"Workflow {name} {'enabled' if enabled else 'disabled'}")
-            return True
+        with self._lock:
+            workflows = self.load_workflows()
+            
+            if name in workflows:
+                workflows[name]['enabled'] = enabled
+                self.save_workflows(workflows)
+                logger.info(f"Workflow {name} {'enabled' if enabled else 'disabled'}")
+                return True
         
         return False
     
@@ -223,19 +238,30 @@ class WorkflowScheduler:
             return {}
         
         try:
-            with open(self.workflows_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json_file(self.workflows_file)
         except Exception as e:
             logger.error(f"Failed to load workflows: {e}")
             return {}
     
     def save_workflows(self, workflows: Dict[str, Any]):
-        """Save workflows to file"""
+        """Save workflows to file, replacing it atomically"""
         try:
             self.workflows_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(self.workflows_file, 'w', encoding='utf-8') as f:
-                json.dump(workflows, f, indent=2, ensure_ascii=False)
+            # Unique temp name so concurrent savers (CLI, Streamlit) never
+            # write to each other's temp file
+            fd, tmp_file = tempfile.mkstemp(
+                dir=self.workflows_dir,
+                prefix=f"{self.workflows_file.name}.",
+                suffix='.tmp'
+            )
+            os.close(fd)
+            try:
+                save_json_file(workflows, tmp_file)
+                os.replace(tmp_file, self.workflows_file)
+            except Exception:
+                os.unlink(tmp_file)
+                raise
             
             logger.info("Workflows saved")
             
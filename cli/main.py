@@ -107,6 +107,9 @@ def batch_convert(
     Returns:
         True if at least one file converted successfully
     """
+    # Imported here so other commands don't load the Workflows package
+    from Workflows.batch_processor import find_files
+    
     try:
         input_path = Path(input_dir)
         output_path = Path(output_dir)
@@ -119,18 +122,8 @@ def batch_convert(
         # Create output directory
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Find files
-        if recursive:
-            files = list(input_path.rglob('*.*'))
-        else:
-            files = list(input_path.glob('*.*'))
-        
-        # Filter supported files
-        supported_formats = get_supported_formats()
-        files = [
-            f for f in files
-            if f.is_file() and f.suffix.lower().replace('.', '') in supported_formats
-        ]
+        # Find supported files
+        files = find_files(input_path, extensions=get_supported_formats(), recursive=recursive)
         
         if not files:
             console.print("[yellow]No supported files found in directory[/yellow]")
@@ -12,6 +12,55 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 
+def _run_convert(args):
+    """Handle the ``convert`` command"""
+    from cli.main import convert_file
+    convert_file(args.input, args.output, quality=args.quality)
+
+
+def _run_batch(args):
+    """Handle the ``batch`` command"""
+    from cli.main import batch_convert
+    batch_convert(
+        args.input_dir, 
+        args.output_dir or './outputs',
+        args.output_format,
+        recursive=args.recursive
+    )
+
+
+def _run_api(args):
+    """Handle the ``api`` command"""
+    import uvicorn
+    uvicorn.run(
+        "api.main:app",
+        host=args.host,
+        port=args.port,
+        reload=args.reload
+    )
+
+
+def _run_streamlit(args):
+    """Handle the ``streamlit`` command"""
+    import subprocess
+    subprocess.run([
+        'streamlit', 'run', 
+        'streamlit_app/app.py',
+        '--server.port', str(args.port)
+    ])
+
+
+def _run_formats(args):
+    """Handle the ``formats`` command"""
+    from cli.main import list_formats
+    list_formats()
+
+
+def _run_version(args):
+    """Handle the ``version`` command"""
+    print("Universal Document Converter v1.0.0")
+
+
 def main():
     """Main entry point for the application"""
     parser = argparse.ArgumentParser(
@@ -44,6 +93,7 @@ Examples:
     convert_parser.add_argument('output', help='Output file path')
     convert_parser.add_argument('--quality', choices=['low', 'medium', 'high'], 
                                 default='high', help='Conversion quality')
+    convert_parser.set_defaults(func=_run_convert)
     
     # Batch convert command
     batch_parser = subparsers.add_parser('batch', help='Batch convert files')
@@ -54,22 +104,27 @@ Examples:
                              help='Target format')
     batch_parser.add_argument('--recursive', action='store_true', 
                              help='Process subdirectories')
+    batch_parser.set_defaults(func=_run_batch)
     
     # API command
     api_parser = subparsers.add_parser('api', help='Start API server')
     api_parser.add_argument('--host', default='0.0.0.0', help='Host address')
     api_parser.add_argument('--port', type=int, default=8000, help='Port number')
     api_parser.add_argument('--reload', action='store_true', help='Enable auto-reload')
+    api_parser.set_defaults(func=_run_api)
     
     # Streamlit command
     streamlit_parser = subparsers.add_parser('streamlit', help='Start Streamlit UI')
     streamlit_parser.add_argument('--port', type=int, default=8501, help='Port number')
+    streamlit_parser.set_defaults(func=_run_streamlit)
     
     # Formats command
     formats_parser = subparsers.add_parser('formats', help='List supported formats')
+    formats_parser.set_defaults(func=_run_formats)
     
     # Version command
     version_parser = subparsers.add_parser('version', help='Show version')
+    version_parser.set_defaults(func=_run_version)
     
     args = parser.parse_args()
     
@@ -77,43 +132,8 @@ Examples:
         parser.print_help()
         return
     
-    # Route to appropriate handler
-    if args.command == 'convert':
-        from cli.main import convert_file
-        convert_file(args.input, args.output, quality=args.quality)
-        
-    elif args.command == 'batch':
-        from cli.main import batch_convert
-        batch_convert(
-            args.input_dir, 
-            args.output_dir or './outputs',
-            args.output_format,
-            recursive=args.recursive
-        )
-        
-    elif args.command == 'api':
-        import uvicorn
-        uvicorn.run(
-            "api.main:app",
-            host=args.host,
-            port=args.port,
-            reload=args.reload
-        )
-        
-    elif args.command == 'streamlit':
-        import subprocess
-        subprocess.run([
-            'streamlit', 'run', 
-            'streamlit_app/app.py',
-            '--server.port', str(args.port)
-        ])
-        
-    elif args.command == 'formats':
-        from cli.main import list_formats
-        list_formats()
-        
-    elif args.command == 'version':
-        print("Universal Document Converter v1.0.0")
+    # Route to the handler registered on the chosen subparser
+    args.func(args)
 
 
 if __name__ == '__main__':
@@ -9,6 +9,9 @@ from pathlib import Path
 import time
 import io
 import zipfile
+import hashlib
+import asyncio
+import aiofiles
 from datetime import datetime
 
 # Add project root to path
@@ -16,15 +19,109 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from converters import ConverterFactory, get_supported_formats, get_supported_conversions
 from utils.validators import validate_file
-from utils.helpers import format_file_size, get_file_size
+from utils.helpers import format_file_size, get_file_size, add_file_to_zip
 from utils.errors import ConversionError, UnsupportedFormatError
+from utils.config_loader import get_batch_settings
 from Workflows import batch_convert_directory
 import tempfile
 import shutil
 
+# Use zlib-ng's SIMD deflate/CRC32 for ZIP downloads when it is installed.
+# Only zipfile's references are swapped; the global zlib module is untouched.
+try:
+    from zlib_ng import zlib_ng
+    zipfile.zlib = zlib_ng
+    zipfile.crc32 = zlib_ng.crc32
+except ImportError:
+    pass
+
 # Constants
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 VERSION = "1.1.0"
+PRECOMPRESSED_FORMATS = {'pdf', 'docx', 'xlsx'}
+
+# About page content; cached since it only depends on module constants
+@st.cache_data
+def about_markdown():
+    return f"""
+    ### 🎯 Features
+    
+    - **30+ Conversion Pairs** - Convert between 6 different formats
+    - **High Quality** - Preserve formatting and content
+    - **Batch Processing** - Convert multiple files at once
+    - **Bulk Download** - Download all converted files as ZIP
+    - **Conversion History** - Track your recent conversions
+    - **Smart Limits** - File size validation (Max: {format_file_size(MAX_FILE_SIZE)})
+    - **Fast & Efficient** - Optimized conversion algorithms
+    - **Easy to Use** - Simple drag-and-drop interface
+    
+    ### 📋 Supported Formats
+    
+    | Format | Description | Extensions |
+    |--------|-------------|------------|
+    | PDF | Portable Document Format | .pdf |
+    | DOCX | Microsoft Word Document | .docx |
+    | XLSX | Microsoft Excel Spreadsheet | .xlsx |
+    | CSV | Comma-Separated Values | .csv |
+    | JSON | JavaScript Object Notation | .json |
+    | TXT | Plain Text File | .txt |
+    
+    ### 🔄 Conversion Matrix
+    
+    All formats can be converted to all other formats (30 total conversions).
+    
+    ### 🚀 How to Use
+    
+    1. **Single File Mode:**
+       - Upload a file (max {format_file_size(MAX_FILE_SIZE)})
+       - Select output format
+       - Click "Convert File"
+       - Download the result
+    
+    2. **Batch Mode:**
+       - Upload multiple files
+       - Select output format for all
+       - Click "Convert All"
+       - Download as ZIP or individually
+    
+    ### ⚙️ Quality Settings
+    
+    - **Low:** Fast conversion, smaller files
+    - **Medium:** Balanced speed and quality
+    - **High:** Best quality, larger files (recommended)
+    
+    ### ✨ New in Version {VERSION}
+    
+    - ✅ File size limits and validation
+    - ✅ Bulk ZIP download for batch conversions
+    - ✅ Conversion history tracking
+    - ✅ Improved error messages with suggestions
+    - ✅ Better progress indicators
+    - ✅ Estimated conversion time
+    - ✅ Session statistics
+    - ✅ Saved user preferences
+    
+    ### 📚 Documentation
+    
+    - [README.md](https://github.com/yourusername/converter) - Project overview
+    - [API Documentation](http://localhost:8000/docs) - REST API reference
+    - [Quick Start Guide](https://github.com/yourusername/converter/QUICKSTART.md)
+    
+    ### 🔧 Technology Stack
+    
+    - **Backend:** Python, FastAPI
+    - **UI:** Streamlit
+    - **Converters:** PyPDF2, python-docx, pandas, reportlab
+    
+    ### 📄 Version
+    
+    **Version:** {VERSION}  
+    **Last Updated:** 2025
+    
+    ---
+    
+    Made with ❤️ by the Universal Document Converter Team
+    """
 
 # Page configuration
 st.set_page_config(
@@ -59,11 +156,20 @@ def estimate_conversion_time(file_size_bytes):
     estimated_seconds = max(1, int(mb_size * 2))
     return estimated_seconds
 
+# Helper function to format history timestamps
+def format_history_time(timestamp):
+    """Format an epoch timestamp (or a legacy datetime entry) as HH:MM local time"""
+    if isinstance(timestamp, datetime):
+        return timestamp.strftime("%H:%M")
+    return time.strftime("%H:%M", time.localtime(timestamp))
+
 # Helper function to add to conversion history
 def add_to_history(input_file, input_format, output_format, file_size, conversion_time, success=True):
     """Add conversion to history"""
-    st.session_state.conversion_history.insert(0, {
-        'timestamp': datetime.now(),
+    state = st.session_state
+    history = state.conversion_history
+    history.insert(0, {
+        'timestamp': time.time(),
         'input_file': input_file,
         'input_format': input_format.upper(),
         'output_format': output_format.upper(),
@@ -72,11 +178,72 @@ def add_to_history(input_file, input_format, output_format, file_size, conversio
         'success': success
     })
     # Keep only last 20 conversions
-    st.session_state.conversion_history = st.session_state.conversion_history[:20]
+    del history[20:]
     
     if success:
-        st.session_state.total_conversions += 1
-        st.session_state.total_files_converted += 1
+        state.total_conversions += 1
+        state.total_files_converted += 1
+
+# Helper coroutine to convert a batch of uploads concurrently
+async def convert_uploads_async(uploaded_files, input_dir, output_dir, output_format, quality, on_progress=None):
+    """
+    Convert uploaded files, overlapping temp-file writes with conversions
+    
+    Conversions run in worker threads, bounded by the batch max_concurrent
+    setting. Uploads with identical content and format are converted once.
+    Returns one outcome dict per upload, in upload order.
+    """
+    semaphore = asyncio.Semaphore(get_batch_settings().get('max_concurrent', 4))
+    # Pending conversions keyed by input format and content digest
+    conversions = {}
+    total = len(uploaded_files)
+    done = 0
+    
+    async def convert_unique(input_path, data, output_path):
+        async with semaphore:
+            async with aiofiles.open(input_path, 'wb') as f:
+                await f.write(data)
+            await asyncio.to_thread(factory.convert, input_path, output_path, quality=quality)
+        return output_path
+    
+    async def convert_one(idx, file):
+        nonlocal done
+        input_format = Path(file.name).suffix.lower().replace('.', '')
+        outcome = {
+            'file': file,
+            'input_format': input_format,
+            'supported': factory.supports_conversion(input_format, output_format),
+            'path': None,
+            'time': 0,
+            'error': None
+        }
+        
+        if not outcome['supported']:
+            outcome['error'] = f"Conversion from {input_format} to {output_format} not supported"
+        else:
+            data = file.getvalue()
+            digest_key = (input_format, hashlib.blake2b(data, digest_size=16).digest())
+            if digest_key not in conversions:
+                # Index prefix keeps same-named uploads from clobbering each other
+                conversions[digest_key] = asyncio.ensure_future(convert_unique(
+                    input_dir / f"{idx}_{file.name}",
+                    data,
+                    output_dir / f"{idx}_{Path(file.name).stem}.{output_format}"
+                ))
+            
+            start_time = time.time()
+            try:
+                outcome['path'] = await conversions[digest_key]
+                outcome['time'] = time.time() - start_time
+            except Exception as e:
+                outcome['error'] = str(e)
+        
+        done += 1
+        if on_progress:
+            on_progress(done, total, file.name)
+        return outcome
+    
+    return await asyncio.gather(*(convert_one(idx, file) for idx, file in enumerate(uploaded_files)))
 
 # Custom CSS
 st.markdown("""
@@ -171,10 +338,13 @@ with st.sidebar:
     st.divider()
     
     # Conversion History
-    if st.session_state.conversion_history:
+    history = st.session_state.conversion_history
+    if history:
         st.subheader("📜 Recent Conversions")
         
-        for idx, item in enumerate(st.session_state.conversion_history[:5]):
+        # Build all entries into one block so the frontend receives a single element
+        history_items = []
+        for item in history[:5]:
             if item['success']:
                 icon = "✅"
                 color = "#28a745"
@@ -182,14 +352,15 @@ with st.sidebar:
                 icon = "❌"
                 color = "#dc3545"
             
-            time_str = item['timestamp'].strftime("%H:%M")
-            st.markdown(f"""
+            time_str = format_history_time(item['timestamp'])
+            history_items.append(f"""
             <div style='font-size: 0.85rem; padding: 0.3rem; margin: 0.2rem 0; 
                         border-left: 3px solid {color}; background-color: #f8f9fa;'>
                 {icon} <b>{item['input_file'][:20]}...</b><br/>
                 <span style='color: #666;'>{item['input_format']} → {item['output_format']} • {time_str}</span>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        st.markdown("".join(history_items), unsafe_allow_html=True)
         
         if st.button("🗑️ Clear History", use_container_width=True):
             st.session_state.conversion_history = []
@@ -301,8 +472,7 @@ if mode == "Single File":
                 status_text.text("✅ Conversion complete!")
                 
                 # Read converted file
-                with open(result, 'rb') as f:
-                    converted_data = f.read()
+                converted_data = Path(result).read_bytes()
                 
                 progress_bar.progress(100)
                 
@@ -399,9 +569,10 @@ elif mode == "Batch Conversion":
         
         # Show file list with total size
         with st.expander("📋 View uploaded files"):
-            for file in uploaded_files:
-                file_size = len(file.getvalue())
-                st.text(f"• {file.name} ({format_file_size(file_size)})")
+            st.code("\n".join(
+                f"• {file.name} ({format_file_size(len(file.getvalue()))})"
+                for file in uploaded_files
+            ), language=None)
             st.divider()
             st.text(f"Total size: {format_file_size(total_size)}")
         
@@ -432,76 +603,56 @@ elif mode == "Batch Conversion":
                 input_dir.mkdir()
                 output_dir.mkdir()
                 
-                # Save all files
-                st.info("📥 Saving uploaded files...")
-                for file in uploaded_files:
-                    file_path = input_dir / file.name
-                    with open(file_path, 'wb') as f:
-                        f.write(file.getvalue())
-                
                 # Progress tracking
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                # Convert files
+                def show_batch_progress(done, total, file_name):
+                    status_text.text(f"🔄 Converted {file_name} ({done}/{total})")
+                    progress_bar.progress(int(done / total * 100))
+                
+                # Convert files; temp writes and conversions overlap across files
+                batch_start_time = time.time()
+                outcomes = asyncio.run(convert_uploads_async(
+                    uploaded_files,
+                    input_dir,
+                    output_dir,
+                    output_format,
+                    quality,
+                    on_progress=show_batch_progress
+                ))
+                
                 results = {
                     'successful': [],
                     'failed': []
                 }
                 
-                batch_start_time = time.time()
-                
-                for idx, file in enumerate(uploaded_files):
-                    try:
-                        status_text.text(f"🔄 Converting {file.name}... ({idx + 1}/{len(uploaded_files)})")
-                        
-                        input_path = input_dir / file.name
-                        input_format = Path(file.name).suffix.lower().replace('.', '')
-                        
-                        # Check if conversion is supported
-                        if factory.supports_conversion(input_format, output_format):
-                            output_path = output_dir / f"{Path(file.name).stem}.{output_format}"
-                            
-                            file_start_time = time.time()
-                            factory.convert(input_path, output_path, quality=quality)
-                            file_conversion_time = time.time() - file_start_time
-                            
-                            # Read converted file
-                            with open(output_path, 'rb') as f:
-                                converted_data = f.read()
-                            
-                            results['successful'].append({
-                                'name': file.name,
-                                'output_name': output_path.name,
-                                'data': converted_data,
-                                'time': file_conversion_time
-                            })
-                            
-                            # Add to history
-                            add_to_history(
-                                file.name,
-                                input_format,
-                                output_format,
-                                len(file.getvalue()),
-                                file_conversion_time,
-                                success=True
-                            )
-                        else:
-                            results['failed'].append({
-                                'name': file.name,
-                                'error': f"Conversion from {input_format} to {output_format} not supported"
-                            })
-                        
-                    except Exception as e:
+                for outcome in outcomes:
+                    file = outcome['file']
+                    if outcome['error'] is None:
+                        # Keep the path only; bytes are read when the ZIP and
+                        # download buttons are built, while tmp_dir is still alive
+                        results['successful'].append({
+                            'name': file.name,
+                            'output_name': f"{Path(file.name).stem}.{output_format}",
+                            'path': outcome['path'],
+                            'time': outcome['time']
+                        })
+                        add_to_history(
+                            file.name,
+                            outcome['input_format'],
+                            output_format,
+                            len(file.getvalue()),
+                            outcome['time'],
+                            success=True
+                        )
+                    else:
                         results['failed'].append({
                             'name': file.name,
-                            'error': str(e)
+                            'error': outcome['error']
                         })
-                        add_to_history(file.name, input_format, output_format, len(file.getvalue()), 0, success=False)
-                    
-                    # Update progress
-                    progress = int((idx + 1) / len(uploaded_files) * 100)
-                    progress_bar.progress(progress)
+                        if outcome['supported']:
+                            add_to_history(file.name, outcome['input_format'], output_format, len(file.getvalue()), 0, success=False)
                 
                 total_batch_time = time.time() - batch_start_time
                 status_text.text("✅ Batch conversion complete!")
@@ -526,10 +677,24 @@ elif mode == "Batch Conversion":
                     st.subheader("⬇️ Download Converted Files")
                     
                     # Create ZIP file for bulk download
+                    # Zip64 records are only needed past the classic 4GB / 65535 entry limits
+                    needs_zip64 = (
+                        len(results['successful']) >= zipfile.ZIP_FILECOUNT_LIMIT
+                        or sum(get_file_size(r['path']) for r in results['successful']) >= zipfile.ZIP64_LIMIT
+                    )
+                    # PDF/DOCX/XLSX are already compressed containers, so store them as-is
+                    entry_compression = (
+                        zipfile.ZIP_STORED if output_format in PRECOMPRESSED_FORMATS
+                        else zipfile.ZIP_DEFLATED
+                    )
+                    
                     zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                    with zipfile.ZipFile(
+                        zip_buffer, 'w', entry_compression,
+                        allowZip64=needs_zip64, compresslevel=1
+                    ) as zip_file:
                         for result in results['successful']:
-                            zip_file.writestr(result['output_name'], result['data'])
+                            add_file_to_zip(zip_file, result['path'], result['output_name'])
                     
                     zip_buffer.seek(0)
                     
@@ -554,7 +719,7 @@ elif mode == "Batch Conversion":
                         with col2:
                             st.download_button(
                                 label="Download",
-                                data=result['data'],
+                                data=result['path'].read_bytes(),
                                 file_name=result['output_name'],
                                 mime="application/octet-stream",
                                 key=f"download_{result['output_name']}"
@@ -572,95 +737,18 @@ elif mode == "Batch Conversion":
 else:  # About
     st.header("ℹ️ About Universal Document Converter")
     
-    st.markdown(f"""
-    ### 🎯 Features
-    
-    - **30+ Conversion Pairs** - Convert between 6 different formats
-    - **High Quality** - Preserve formatting and content
-    - **Batch Processing** - Convert multiple files at once
-    - **Bulk Download** - Download all converted files as ZIP
-    - **Conversion History** - Track your recent conversions
-    - **Smart Limits** - File size validation (Max: {format_file_size(MAX_FILE_SIZE)})
-    - **Fast & Efficient** - Optimized conversion algorithms
-    - **Easy to Use** - Simple drag-and-drop interface
-    
-    ### 📋 Supported Formats
-    
-    | Format | Description | Extensions |
-    |--------|-------------|------------|
-    | PDF | Portable Document Format | .pdf |
-    | DOCX | Microsoft Word Document | .docx |
-    | XLSX | Microsoft Excel Spreadsheet | .xlsx |
-    | CSV | Comma-Separated Values | .csv |
-    | JSON | JavaScript Object Notation | .json |
-    | TXT | Plain Text File | .txt |
-    
-    ### 🔄 Conversion Matrix
-    
-    All formats can be converted to all other formats (30 total conversions).
-    
-    ### 🚀 How to Use
-    
-    1. **Single File Mode:**
-       - Upload a file (max {format_file_size(MAX_FILE_SIZE)})
-       - Select output format
-       - Click "Convert File"
-       - Download the result
-    
-    2. **Batch Mode:**
-       - Upload multiple files
-       - Select output format for all
-       - Click "Convert All"
-       - Download as ZIP or individually
-    
-    ### ⚙️ Quality Settings
-    
-    - **Low:** Fast conversion, smaller files
-    - **Medium:** Balanced speed and quality
-    - **High:** Best quality, larger files (recommended)
-    
-    ### ✨ New in Version {VERSION}
-    
-    - ✅ File size limits and validation
-    - ✅ Bulk ZIP download for batch conversions
-    - ✅ Conversion history tracking
-    - ✅ Improved error messages with suggestions
-    - ✅ Better progress indicators
-    - ✅ Estimated conversion time
-    - ✅ Session statistics
-    - ✅ Saved user preferences
-    
-    ### 📚 Documentation
-    
-    - [README.md](https://github.com/yourusername/converter) - Project overview
-    - [API Documentation](http://localhost:8000/docs) - REST API reference
-    - [Quick Start Guide](https://github.com/yourusername/converter/QUICKSTART.md)
-    
-    ### 🔧 Technology Stack
-    
-    - **Backend:** Python, FastAPI
-    - **UI:** Streamlit
-    - **Converters:** PyPDF2, python-docx, pandas, reportlab
-    
-    ### 📄 Version
-    
-    **Version:** {VERSION}  
-    **Last Updated:** 2025
-    
-    ---
-    
-    Made with ❤️ by the Universal Document Converter Team
-    """)
+    st.markdown(about_markdown())
 
 # Footer
+state = st.session_state
 st.divider()
 st.markdown(f"""
 <div style='text-align: center; color: #666; padding: 2rem;'>
     <p>Universal Document Converter v{VERSION}</p>
     <p>Convert • Transform • Simplify</p>
     <p style='font-size: 0.8rem; margin-top: 1rem;'>
-        Session Stats: {st.session_state.total_conversions} conversions • 
-        {st.session_state.total_files_converted} files processed
+        Session Stats: {state.total_conversions} conversions • 
+        {state.total_files_converted} files processed
     </p>
 </div>
 """, unsafe_allow_html=True)
@@ -4,21 +4,39 @@ Interactive web interface for file conversion
 """
 
 import streamlit as st
+import os
 import sys
 from pathlib import Path
 import time
 import io
+import zipfile
+import tempfile
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add project root to path (once; Streamlit re-executes this script on every rerun)
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-from converters import ConverterFactory, get_supported_formats, get_supported_conversions
 from utils.validators import validate_file
-from utils.helpers import format_file_size, get_file_size
+from utils.helpers import format_file_size, get_file_size, get_file_extension, add_file_to_zip, COPY_BUFFER_SIZE
 from utils.errors import ConversionError
-from Workflows import batch_convert_directory
-import tempfile
-import shutil
+from utils.config_loader import get_batch_settings, get_validation_settings
+
+# Constants
+IN_MEMORY_MAX_SIZE = 10 * 1024 * 1024  # 10MB
+IN_MEMORY_HEADROOM = 4  # required free space in the RAM dir, as a multiple of the upload
+PROGRESS_INTERVAL = 0.1  # seconds between batch progress updates
+
+# RAM-backed temp directory for small single-file conversions (Linux tmpfs).
+# Converters need real paths, so this stands in for an in-memory buffer.
+IN_MEMORY_TMP_DIR = '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+
+# Upload size limit from the validation rules
+MAX_FILE_SIZE_MB = get_validation_settings().get('max_file_size_mb', 100)
+MAX_FILE_SIZE = MAX_FILE_SIZE_MB * 1024 * 1024
 
 # Page configuration
 st.set_page_config(
@@ -28,15 +46,51 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize factory
+# Initialize factory; converters (and their PDF/Office/pandas dependencies)
+# are imported on first use rather than when the page loads
 @st.cache_resource
 def get_factory():
+    from converters import ConverterFactory
     return ConverterFactory()
 
-factory = get_factory()
+# Helper function to choose where a single-file conversion's temp files go
+def pick_tmp_dir(file_size):
+    """RAM-backed dir for small uploads when it has room, else the default temp dir"""
+    if IN_MEMORY_TMP_DIR is None or file_size > IN_MEMORY_MAX_SIZE:
+        return None
+    # Leave room for the input, the converted output and other sessions
+    try:
+        free = shutil.disk_usage(IN_MEMORY_TMP_DIR).free
+    except OSError:
+        return None
+    return IN_MEMORY_TMP_DIR if free >= file_size * IN_MEMORY_HEADROOM else None
+
+# Cached format lookups; these only depend on the registered converters
+@st.cache_data
+def cached_formats():
+    return tuple(get_factory().get_supported_formats())
+
+@st.cache_data
+def cached_conversions(input_format):
+    return tuple(get_factory().get_supported_conversions(input_format))
+
+# Batch results kept as parallel lists rather than one dict per file
+@dataclass(slots=True)
+class BatchResults:
+    names: list = field(default_factory=list)
+    output_names: list = field(default_factory=list)
+    paths: list = field(default_factory=list)
+    failed: list = field(default_factory=list)  # (name, error) tuples
+    
+    def add_success(self, name, output_name, path):
+        self.names.append(name)
+        self.output_names.append(output_name)
+        self.paths.append(path)
 
 # Custom CSS
-st.markdown("""
+@st.cache_data
+def page_css():
+    return """
 <style>
     .main-header {
         font-size: 3rem;
@@ -73,7 +127,9 @@ st.markdown("""
         color: #0c5460;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(page_css(), unsafe_allow_html=True)
 
 # Header
 st.markdown('<div class="main-header">📄 Universal Document Converter</div>', unsafe_allow_html=True)
@@ -104,7 +160,8 @@ with st.sidebar:
     
     # Supported formats
     st.subheader("📋 Supported Formats")
-    formats = get_supported_formats()
+    # Cached across reruns, so the converters are imported once per process
+    formats = cached_formats()
     for fmt in formats:
         st.text(f"• {fmt.upper()}")
     
@@ -113,12 +170,13 @@ with st.sidebar:
     # Statistics
     st.subheader("📊 Statistics")
     st.metric("Total Formats", len(formats))
-    total_conversions = sum(len(get_supported_conversions(fmt)) for fmt in formats)
+    total_conversions = sum(len(cached_conversions(fmt)) for fmt in formats)
     st.metric("Total Conversions", total_conversions)
 
 # Main content
 if mode == "Single File":
     st.header("📤 Single File Conversion")
+    factory = get_factory()
     
     col1, col2 = st.columns(2)
     
@@ -127,12 +185,16 @@ if mode == "Single File":
         uploaded_file = st.file_uploader(
             "Choose a file to convert",
             type=['pdf', 'docx', 'xlsx', 'csv', 'json', 'txt'],
-            help="Upload a file in any supported format"
+            help=f"Upload a file in any supported format (Max {MAX_FILE_SIZE_MB}MB per file)"
         )
         
         if uploaded_file:
+            if uploaded_file.size > MAX_FILE_SIZE:
+                st.error(f"❌ File exceeds the {MAX_FILE_SIZE_MB}MB limit")
+                st.stop()
+            
             st.success(f"✓ File uploaded: {uploaded_file.name}")
-            file_size = len(uploaded_file.getvalue())
+            file_size = uploaded_file.size
             st.info(f"📦 Size: {format_file_size(file_size)}")
     
     with col2:
@@ -140,10 +202,10 @@ if mode == "Single File":
         
         if uploaded_file:
             # Get input format
-            input_format = Path(uploaded_file.name).suffix.lower().replace('.', '')
+            input_format = get_file_extension(uploaded_file.name)
             
             # Get available conversions
-            available_formats = get_supported_conversions(input_format)
+            available_formats = cached_conversions(input_format)
             
             if available_formats:
                 output_format = st.selectbox(
@@ -173,6 +235,7 @@ if mode == "Single File":
             )
         
         if convert_button:
+            tmp_input_path = tmp_output_path = None
             try:
                 # Create progress bar
                 progress_bar = st.progress(0)
@@ -182,9 +245,11 @@ if mode == "Single File":
                 status_text.text("📥 Saving uploaded file...")
                 progress_bar.progress(20)
                 
-                with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp_input:
-                    tmp_input.write(uploaded_file.getvalue())
+                tmp_dir = pick_tmp_dir(uploaded_file.size)
+                with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix, dir=tmp_dir) as tmp_input:
                     tmp_input_path = Path(tmp_input.name)
+                    uploaded_file.seek(0)
+                    shutil.copyfileobj(uploaded_file, tmp_input, length=COPY_BUFFER_SIZE)
                 
                 # Create output path
                 status_text.text("🔄 Converting file...")
@@ -204,10 +269,6 @@ if mode == "Single File":
                 progress_bar.progress(80)
                 status_text.text("✅ Conversion complete!")
                 
-                # Read converted file
-                with open(result, 'rb') as f:
-                    converted_data = f.read()
-                
                 progress_bar.progress(100)
                 
                 # Success message
@@ -222,27 +283,33 @@ if mode == "Single File":
                 with col3:
                     st.metric("Conversion Time", f"{conversion_time:.2f}s")
                 
-                # Download button
-                st.download_button(
-                    label="⬇️ Download Converted File",
-                    data=converted_data,
-                    file_name=f"{Path(uploaded_file.name).stem}.{output_format}",
-                    mime="application/octet-stream",
-                    type="primary",
-                    use_container_width=True
-                )
-                
-                # Cleanup
-                tmp_input_path.unlink(missing_ok=True)
-                tmp_output_path.unlink(missing_ok=True)
+                # Download button; Streamlit consumes the file handle during this
+                # call, so the file can be closed and removed right afterwards
+                with open(result, 'rb', buffering=COPY_BUFFER_SIZE) as download_file:
+                    st.download_button(
+                        label="⬇️ Download Converted File",
+                        data=download_file,
+                        file_name=f"{Path(uploaded_file.name).stem}.{output_format}",
+                        mime="application/octet-stream",
+                        type="primary",
+                        use_container_width=True
+                    )
                 
             except Exception as e:
                 st.error(f"❌ Conversion failed: {str(e)}")
                 progress_bar.empty()
                 status_text.empty()
+            
+            finally:
+                # Cleanup; failed conversions must not leave files in RAM-backed storage
+                if tmp_input_path is not None:
+                    tmp_input_path.unlink(missing_ok=True)
+                if tmp_output_path is not None:
+                    tmp_output_path.unlink(missing_ok=True)
 
 elif mode == "Batch Conversion":
     st.header("📦 Batch Conversion")
+    factory = get_factory()
     
     st.info("💡 Upload multiple files to convert them all at once")
     
@@ -251,22 +318,31 @@ elif mode == "Batch Conversion":
         "Choose files to convert",
         type=['pdf', 'docx', 'xlsx', 'csv', 'json', 'txt'],
         accept_multiple_files=True,
-        help="Upload multiple files for batch conversion"
+        help=f"Upload multiple files for batch conversion (Max {MAX_FILE_SIZE_MB}MB per file)"
     )
     
+    if uploaded_files:
+        # Drop oversized files before anything is written to disk
+        oversized_files = [f for f in uploaded_files if f.size > MAX_FILE_SIZE]
+        if oversized_files:
+            st.warning(
+                f"⚠️ Skipping {len(oversized_files)} file(s) over the {MAX_FILE_SIZE_MB}MB limit: "
+                + ", ".join(f.name for f in oversized_files)
+            )
+            uploaded_files = [f for f in uploaded_files if f.size <= MAX_FILE_SIZE]
+    
     if uploaded_files:
         st.success(f"✓ {len(uploaded_files)} files uploaded")
         
         # Show file list
         with st.expander("📋 View uploaded files"):
             for file in uploaded_files:
-                file_size = len(file.getvalue())
-                st.text(f"• {file.name} ({format_file_size(file_size)})")
+                st.text(f"• {file.name} ({format_file_size(file.size)})")
         
         # Output format selection
         output_format = st.selectbox(
             "Select output format for all files",
-            get_supported_formats(),
+            cached_formats(),
             format_func=lambda x: x.upper()
         )
         
@@ -290,60 +366,70 @@ elif mode == "Batch Conversion":
                 input_dir.mkdir()
                 output_dir.mkdir()
                 
-                # Save all files
+                # Split off unsupported files up front so they are never saved
+                supported_inputs = {
+                    fmt for fmt in cached_formats()
+                    if factory.supports_conversion(fmt, output_format)
+                }
+                convertible = [f for f in uploaded_files if get_file_extension(f.name) in supported_inputs]
+                
+                # Convert files
+                results = BatchResults()
+                results.failed.extend(
+                    (f.name, f"Conversion from {get_file_extension(f.name)} to {output_format} not supported")
+                    for f in uploaded_files if get_file_extension(f.name) not in supported_inputs
+                )
+                
+                # Save convertible files
                 st.info("📥 Saving uploaded files...")
-                for file in uploaded_files:
+                for file in convertible:
                     file_path = input_dir / file.name
                     with open(file_path, 'wb') as f:
-                        f.write(file.getvalue())
+                        file.seek(0)
+                        shutil.copyfileobj(file, f, length=COPY_BUFFER_SIZE)
                 
                 # Progress tracking
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                # Convert files
-                results = {
-                    'successful': [],
-                    'failed': []
-                }
+                jobs = [
+                    (
+                        input_dir / file.name,
+                        output_dir / f"{Path(file.name).stem}.{output_format}",
+                        file.name
+                    )
+                    for file in convertible
+                ]
                 
-                for idx, file in enumerate(uploaded_files):
-                    try:
-                        status_text.text(f"🔄 Converting {file.name}...")
-                        
-                        input_path = input_dir / file.name
-                        input_format = Path(file.name).suffix.lower().replace('.', '')
-                        
-                        # Check if conversion is supported
-                        if factory.supports_conversion(input_format, output_format):
-                            output_path = output_dir / f"{Path(file.name).stem}.{output_format}"
-                            
-                            factory.convert(input_path, output_path, quality=quality)
+                done = len(results.failed)
+                progress_bar.progress(int(done / len(uploaded_files) * 100))
+                last_update = time.monotonic()
+                
+                # Convert in worker threads; Streamlit calls stay on this thread
+                max_workers = get_batch_settings().get('max_concurrent', 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(factory.convert, input_path, output_path, quality=quality): (name, output_path)
+                        for input_path, output_path, name in jobs
+                    }
+                    
+                    for future in as_completed(futures):
+                        name, output_path = futures[future]
+                        try:
+                            future.result()
                             
-                            # Read converted file
-                            with open(output_path, 'rb') as f:
-                                converted_data = f.read()
+                            results.add_success(name, output_path.name, output_path)
                             
-                            results['successful'].append({
-                                'name': file.name,
-                                'output_name': output_path.name,
-                                'data': converted_data
-                            })
-                        else:
-                            results['failed'].append({
-                                'name': file.name,
-                                'error': f"Conversion from {input_format} to {output_format} not supported"
-                            })
+                        except Exception as e:
+                            results.failed.append((name, str(e)))
                         
-                    except Exception as e:
-                        results['failed'].append({
-                            'name': file.name,
-                            'error': str(e)
-                        })
-                    
-                    # Update progress
-                    progress = int((idx + 1) / len(uploaded_files) * 100)
-                    progress_bar.progress(progress)
+                        # Update progress, at most every PROGRESS_INTERVAL seconds
+                        done += 1
+                        now = time.monotonic()
+                        if now - last_update >= PROGRESS_INTERVAL or done == len(uploaded_files):
+                            status_text.text(f"🔄 Converted {name}... ({done}/{len(uploaded_files)})")
+                            progress_bar.progress(int(done / len(uploaded_files) * 100))
+                            last_update = now
                 
                 status_text.text("✅ Batch conversion complete!")
                 
@@ -354,36 +440,43 @@ elif mode == "Batch Conversion":
                 with col1:
                     st.metric("Total Files", len(uploaded_files))
                 with col2:
-                    st.metric("Successful", len(results['successful']), delta_color="normal")
+                    st.metric("Successful", len(results.names), delta_color="normal")
                 with col3:
-                    st.metric("Failed", len(results['failed']), delta_color="inverse")
+                    st.metric("Failed", len(results.failed), delta_color="inverse")
                 
                 # Show successful conversions
-                if results['successful']:
-                    st.success(f"✅ {len(results['successful'])} files converted successfully!")
+                if results.names:
+                    st.success(f"✅ {len(results.names)} files converted successfully!")
                     
                     st.subheader("⬇️ Download Converted Files")
                     
-                    for result in results['successful']:
-                        col1, col2 = st.columns([3, 1])
-                        with col1:
-                            st.text(f"📄 {result['output_name']}")
-                        with col2:
-                            st.download_button(
-                                label="Download",
-                                data=result['data'],
-                                file_name=result['output_name'],
-                                mime="application/octet-stream",
-                                key=f"download_{result['output_name']}"
-                            )
+                    for output_name in results.output_names:
+                        st.text(f"📄 {output_name}")
+                    
+                    # Pack outputs straight from the temp directory into one archive;
+                    # it stays in memory up to 50MB and spills to disk beyond that
+                    with tempfile.SpooledTemporaryFile(max_size=50 * 1024 * 1024) as zip_buffer:
+                        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+                            for output_name, path in zip(results.output_names, results.paths):
+                                add_file_to_zip(zip_file, path, output_name)
+                        
+                        zip_buffer.seek(0)
+                        st.download_button(
+                            label=f"📦 Download All as ZIP ({len(results.names)} files)",
+                            data=zip_buffer.read(),
+                            file_name="converted.zip",
+                            mime="application/zip",
+                            type="primary",
+                            use_container_width=True
+                        )
                 
                 # Show failed conversions
-                if results['failed']:
-                    st.error(f"❌ {len(results['failed'])} files failed to convert")
+                if results.failed:
+                    st.error(f"❌ {len(results.failed)} files failed to convert")
                     
                     with st.expander("View errors"):
-                        for result in results['failed']:
-                            st.text(f"• {result['name']}: {result['error']}")
+                        for name, error in results.failed:
+                            st.text(f"• {name}: {error}")
 
 else:  # About
     st.header("ℹ️ About Universal Document Converter")
@@ -455,10 +548,14 @@ else:  # About
     """)
 
 # Footer
-st.divider()
-st.markdown("""
+@st.cache_data
+def page_footer():
+    return """
 <div style='text-align: center; color: #666; padding: 2rem;'>
     <p>Universal Document Converter v1.0.0</p>
     <p>Convert • Transform • Simplify</p>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+st.divider()
+st.markdown(page_footer(), unsafe_allow_html=True)
@@ -7,7 +7,10 @@ import streamlit as st
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root to path (once; Streamlit re-executes this script on every rerun)
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from Workflows import WorkflowScheduler, list_workflows
 
@@ -21,7 +24,24 @@ st.title("📋 Conversion Workflows")
 st.markdown("Create and manage automated conversion workflows")
 
 # Initialize scheduler
-scheduler = WorkflowScheduler()
+@st.cache_resource
+def get_scheduler():
+    """
+    Process-wide scheduler shared by all sessions
+    
+    Workflows are global to the installation rather than per user, so a
+    single instance lives for the lifetime of the Streamlit process.
+    """
+    return WorkflowScheduler()
+
+scheduler = get_scheduler()
+
+
+@st.cache_data(ttl=30)
+def cached_workflows():
+    """List workflows, cached across reruns until a workflow changes"""
+    return list_workflows()
+
 
 # Tabs
 tab1, tab2, tab3 = st.tabs(["📝 Create Workflow", "▶️ Run Workflows", "📊 Manage Workflows"])
@@ -75,6 +95,7 @@ with tab1:
                         quality=quality,
                         recursive=recursive
                     )
+                    cached_workflows.clear()
                     st.success(f"✅ Workflow '{workflow_name}' created successfully!")
                 except Exception as e:
                     st.error(f"❌ Failed to create workflow: {e}")
@@ -84,7 +105,7 @@ with tab1:
 with tab2:
     st.header("Run Workflows")
     
-    workflows = list_workflows()
+    workflows = cached_workflows()
     
     if workflows:
         for workflow in workflows:
@@ -109,6 +130,7 @@ with tab2:
                         with st.spinner(f"Running workflow '{workflow['name']}'..."):
                             try:
                                 results = scheduler.run_workflow(workflow['name'])
+                                cached_workflows.clear()
                                 
                                 if results.get('success', True):
                                     st.success(
@@ -125,7 +147,7 @@ with tab2:
 with tab3:
     st.header("Manage Workflows")
     
-    workflows = list_workflows()
+    workflows = cached_workflows()
     
     if workflows:
         for workflow in workflows:
@@ -141,10 +163,12 @@ with tab3:
                     if enabled:
                         if st.button("Disable", key=f"disable_{workflow['name']}"):
                             scheduler.disable_workflow(workflow['name'])
+                            cached_workflows.clear()
                             st.rerun()
                     else:
                         if st.button("Enable", key=f"enable_{workflow['name']}"):
                             scheduler.enable_workflow(workflow['name'])
+                            cached_workflows.clear()
                             st.rerun()
                 
                 with col3:
@@ -154,6 +178,7 @@ with tab3:
                 with col4:
                     if st.button("🗑️ Delete", key=f"delete_{workflow['name']}"):
                         if scheduler.delete_workflow(workflow['name']):
+                            cached_workflows.clear()
                             st.success(f"Deleted workflow: {workflow['name']}")
                             st.rerun()
                 
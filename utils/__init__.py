@@ -9,7 +9,8 @@ from .helpers import (
     sanitize_filename,
     generate_unique_filename,
     ensure_directory,
-    parse_file_path
+    parse_file_path,
+    clear_file_hash_cache
 )
 from .file_handler import FileHandler, file_handler
 from .progress import (
@@ -30,7 +31,8 @@ from .config_loader import (
     config_loader,
     get_format_rules,
     get_quality_settings,
-    get_batch_settings
+    get_batch_settings,
+    get_validation_settings
 )
 
 __all__ = [
@@ -49,6 +51,7 @@ __all__ = [
     'generate_unique_filename',
     'ensure_directory',
     'parse_file_path',
+    'clear_file_hash_cache',
     # File Handler
     'FileHandler',
     'file_handler',
@@ -68,5 +71,6 @@ __all__ = [
     'config_loader',
     'get_format_rules',
     'get_quality_settings',
-    'get_batch_settings'
+    'get_batch_settings',
+    'get_validation_settings'
 ]
@@ -3,49 +3,136 @@ Configuration loader
 Load and manage conversion rules and settings
 """
 
-import json
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 from config.settings import settings
 from utils.logger import get_logger
+from utils.helpers import load_json_file
 
 logger = get_logger(__name__)
 
 
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples
+    
+    Args:
+        value: Parsed JSON value
+        
+    Returns:
+        Immutable equivalent that is safe to share between threads
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Defaults used when the rules file is missing or incomplete; built once
+_DEFAULT_RULES = _freeze({
+    'conversion_rules': {
+        'pdf': {
+            'quality_settings': {
+                'low': {'dpi': 72, 'compression': 'high'},
+                'medium': {'dpi': 150, 'compression': 'medium'},
+                'high': {'dpi': 300, 'compression': 'low'}
+            },
+            'ocr_enabled': True,
+            'preserve_images': True,
+            'preserve_links': True
+        },
+        'docx': {
+            'preserve_formatting': True,
+            'preserve_styles': True,
+            'preserve_tables': True,
+            'preserve_images': True
+        },
+        'xlsx': {
+            'preserve_formulas': True,
+            'preserve_formatting': True,
+            'max_rows': 1048576,
+            'max_columns': 16384
+        },
+        'csv': {
+            'delimiter': ',',
+            'encoding': 'utf-8',
+            'quote_char': '"',
+            'escape_char': '\\',
+            'line_terminator': '\n'
+        },
+        'json': {
+            'indent': 2,
+            'ensure_ascii': False,
+            'sort_keys': False,
+            'encoding': 'utf-8'
+        },
+        'txt': {
+            'encoding': 'utf-8',
+            'line_ending': 'auto',
+            'preserve_whitespace': True
+        }
+    },
+    'batch_processing': {
+        'max_concurrent': 4,
+        'timeout_seconds': 300,
+        'retry_attempts': 3,
+        'skip_errors': True
+    },
+    'file_validation': {
+        'max_file_size_mb': 100,
+        'scan_for_viruses': False,
+        'validate_content': True
+    }
+})
+_DEFAULT_BATCH = _DEFAULT_RULES['batch_processing']
+_DEFAULT_VALIDATION = _DEFAULT_RULES['file_validation']
+
+
 class ConfigLoader:
     """Load and manage configuration"""
     
     def __init__(self):
         self.rules_file = settings.RULES_DIR / "conversion_rules.json"
         self._rules_cache = None
+        self._lock = threading.Lock()
     
-    def load_conversion_rules(self) -> Dict[str, Any]:
+    def load_conversion_rules(self) -> Mapping[str, Any]:
         """
         Load conversion rules from JSON file
         
+        The rules are parsed once and cached as a read-only mapping; only
+        the first load takes the lock, later calls return the cache directly.
+        
         Returns:
-            Dictionary with conversion rules
+            Read-only mapping with conversion rules
         """
-        if self._rules_cache is not None:
-            return self._rules_cache
-        
-        try:
-            if not self.rules_file.exists():
-                logger.warning(f"Rules file not found: {self.rules_file}")
-                return self._get_default_rules()
-            
-            with open(self.rules_file, 'r', encoding='utf-8') as f:
-                rules = json.load(f)
-            
-            self._rules_cache = rules
-            logger.info("Conversion rules loaded successfully")
+        rules = self._rules_cache
+        if rules is not None:
             return rules
+        
+        with self._lock:
+            if self._rules_cache is not None:
+                return self._rules_cache
             
-        except Exception as e:
-            logger.error(f"Failed to load conversion rules: {e}")
-            return self._get_default_rules()
+            try:
+                if not self.rules_file.exists():
+                    logger.warning(f"Rules file not found: {self.rules_file}")
+                    return self._get_default_rules()
+                
+                rules = _freeze(load_json_file(self.rules_file))
+                
+                self._rules_cache = rules
+                logger.info("Conversion rules loaded successfully")
+                return rules
+                
+            except Exception as e:
+                logger.error(f"Failed to load conversion rules: {e}")
+                return self._get_default_rules()
     
-    def get_format_rules(self, format_name: str) -> Dict[str, Any]:
+    def get_format_rules(self, format_name: str) -> Mapping[str, Any]:
         """
         Get rules for specific format
         
@@ -53,13 +140,13 @@ class ConfigLoader:
             format_name: Format name (e.g., 'pdf', 'docx')
             
         Returns:
-            Format-specific rules
+            Read-only format-specific rules
         """
         rules = self.load_conversion_rules()
         conversion_rules = rules.get('conversion_rules', {})
         return conversion_rules.get(format_name.lower(), {})
     
-    def get_quality_settings(self, format_name: str, quality: str = 'high') -> Dict[str, Any]:
+    def get_quality_settings(self, format_name: str, quality: str = 'high') -> Mapping[str, Any]:
         """
         Get quality settings for format
         
@@ -68,108 +155,46 @@ class ConfigLoader:
             quality: Quality level ('low', 'medium', 'high')
             
         Returns:
-            Quality settings
+            Read-only quality settings
         """
         format_rules = self.get_format_rules(format_name)
         quality_settings = format_rules.get('quality_settings', {})
         return quality_settings.get(quality, quality_settings.get('high', {}))
     
-    def get_batch_settings(self) -> Dict[str, Any]:
+    def get_batch_settings(self) -> Mapping[str, Any]:
         """
         Get batch processing settings
         
         Returns:
-            Batch settings
+            Read-only batch settings
         """
         rules = self.load_conversion_rules()
-        return rules.get('batch_processing', {
-            'max_concurrent': 4,
-            'timeout_seconds': 300,
-            'retry_attempts': 3,
-            'skip_errors': True
-        })
+        return rules.get('batch_processing', _DEFAULT_BATCH)
     
-    def get_validation_settings(self) -> Dict[str, Any]:
+    def get_validation_settings(self) -> Mapping[str, Any]:
         """
         Get file validation settings
         
         Returns:
-            Validation settings
+            Read-only validation settings
         """
         rules = self.load_conversion_rules()
-        return rules.get('file_validation', {
-            'max_file_size_mb': 100,
-            'scan_for_viruses': False,
-            'validate_content': True
-        })
+        return rules.get('file_validation', _DEFAULT_VALIDATION)
     
     def reload_rules(self):
         """Reload rules from file"""
-        self._rules_cache = None
+        with self._lock:
+            self._rules_cache = None
         return self.load_conversion_rules()
     
-    def _get_default_rules(self) -> Dict[str, Any]:
+    def _get_default_rules(self) -> Mapping[str, Any]:
         """
         Get default conversion rules
         
         Returns:
-            Default rules dictionary
+            Read-only default rules
         """
-        return {
-            'conversion_rules': {
-                'pdf': {
-                    'quality_settings': {
-                        'low': {'dpi': 72, 'compression': 'high'},
-                        'medium': {'dpi': 150, 'compression': 'medium'},
-                        'high': {'dpi': 300, 'compression': 'low'}
-                    },
-                    'ocr_enabled': True,
-                    'preserve_images': True,
-                    'preserve_links': True
-                },
-                'docx': {
-                    'preserve_formatting': True,
-                    'preserve_styles': True,
-                    'preserve_tables': True,
-                    'preserve_images': True
-                },
-                'xlsx': {
-                    'preserve_formulas': True,
-                    'preserve_formatting': True,
-                    'max_rows': 1048576,
-                    'max_columns': 16384
-                },
-                'csv': {
-                    'delimiter': ',',
-                    'encoding': 'utf-8',
-                    'quote_char': '"',
-                    'escape_char': '\\',
-                    'line_terminator': '\n'
-                },
-                'json': {
-                    'indent': 2,
-                    'ensure_ascii': False,
-                    'sort_keys': False,
-                    'encoding': 'utf-8'
-                },
-                'txt': {
-                    'encoding': 'utf-8',
-                    'line_ending': 'auto',
-                    'preserve_whitespace': True
-                }
-            },
-            'batch_processing': {
-                'max_concurrent': 4,
-                'timeout_seconds': 300,
-                'retry_attempts': 3,
-                'skip_errors': True
-            },
-            'file_validation': {
-                'max_file_size_mb': 100,
-                'scan_for_viruses': False,
-                'validate_content': True
-            }
-        }
+        return _DEFAULT_RULES
 
 
 # Global instance
@@ -177,16 +202,21 @@ config_loader = ConfigLoader()
 
 
 # Convenience functions
-def get_format_rules(format_name: str) -> Dict[str, Any]:
+def get_format_rules(format_name: str) -> Mapping[str, Any]:
     """Get rules for specific format"""
     return config_loader.get_format_rules(format_name)
 
 
-def get_quality_settings(format_name: str, quality: str = 'high') -> Dict[str, Any]:
+def get_quality_settings(format_name: str, quality: str = 'high') -> Mapping[str, Any]:
     """Get quality settings for format"""
     return config_loader.get_quality_settings(format_name, quality)
 
 
-def get_batch_settings() -> Dict[str, Any]:
+def get_batch_settings() -> Mapping[str, Any]:
     """Get batch processing settings"""
     return config_loader.get_batch_settings()
+
+
+def get_validation_settings() -> Mapping[str, Any]:
+    """Get file validation settings"""
+    return config_loader.get_validation_settings()
@@ -3,12 +3,20 @@ Custom exceptions and error handling
 Defines application-specific exceptions
 """
 
+import builtins
 from typing import Optional, Dict, Any
 
 
 class ConverterError(Exception):
     """Base exception for converter errors"""
     
+    # Reported as 'error' by to_dict(); set per subclass at class creation
+    _class_name = 'ConverterError'
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._class_name = cls.__name__
+    
     def __init__(
         self,
         message: str,
@@ -23,7 +31,7 @@ class ConverterError(Exception):
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary"""
         return {
-            'error': self.__class__.__name__,
+            'error': self._class_name,
             'message': self.message,
             'error_code': self.error_code,
             'details': self.details
@@ -189,6 +197,21 @@ class TimeoutError(ConverterError):
         )
 
 
+# Exception type -> factory(error, input_file); the builtins are shadowed above
+_TYPE_DISPATCH = (
+    (builtins.PermissionError, lambda error, input_file: PermissionError(input_file, "conversion")),
+    (builtins.FileNotFoundError, lambda error, input_file: FileNotFoundError(input_file)),
+    (UnicodeError, lambda error, input_file: EncodingError(str(error))),
+)
+
+# Lower-case message substring -> factory(error, input_file), checked in order
+_MESSAGE_DISPATCH = (
+    ("permission", lambda error, input_file: PermissionError(input_file, "conversion")),
+    ("not found", lambda error, input_file: FileNotFoundError(input_file)),
+    ("encoding", lambda error, input_file: EncodingError(str(error))),
+)
+
+
 def handle_conversion_error(error: Exception, input_file: str = "") -> ConverterError:
     """
     Convert generic exception to ConverterError
@@ -203,18 +226,18 @@ def handle_conversion_error(error: Exception, input_file: str = "") -> Converter
     if isinstance(error, ConverterError):
         return error
     
-    # Map common exceptions
-    error_type = type(error).__name__
-    error_message = str(error)
-    
-    if "permission" in error_message.lower():
-        return PermissionError(input_file, "conversion")
+    # Builtin OS/codec errors map by type, without inspecting the message
+    for error_types, factory in _TYPE_DISPATCH:
+        if isinstance(error, error_types):
+            return factory(error, input_file)
     
-    if "not found" in error_message.lower():
-        return FileNotFoundError(input_file)
+    # Map common exceptions by message
+    error_message = str(error)
+    message_lower = error_message.lower()
     
-    if "encoding" in error_message.lower():
-        return EncodingError(error_message)
+    for needle, factory in _MESSAGE_DISPATCH:
+        if needle in message_lower:
+            return factory(error, input_file)
     
     # Generic conversion error
     return ConversionError(
@@ -3,13 +3,18 @@ File handling utilities
 Manages file operations, uploads, and downloads
 """
 
+import asyncio
+import errno
+import os
 import shutil
+from functools import partial
 from pathlib import Path
 from typing import Optional, BinaryIO, List
 import aiofiles
 from config.settings import settings
 from utils.logger import get_logger
 from utils.helpers import (
+    COPY_BUFFER_SIZE,
     ensure_directory,
     generate_unique_filename,
     sanitize_filename,
@@ -18,6 +23,42 @@ from utils.helpers import (
 
 logger = get_logger(__name__)
 
+# Errors meaning copy_file_range cannot be used between these two files
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+
+def _copy_contents(src: BinaryIO, dst: BinaryIO):
+    """
+    Copy file contents in the kernel when possible
+    
+    Uses os.copy_file_range, which can reflink on copy-on-write filesystems
+    (XFS, Btrfs) and never moves data through userspace. Falls back to a
+    buffered copy where the syscall is unavailable or unsupported.
+    
+    Args:
+        src: Source file opened for binary reading
+        dst: Destination file opened for binary writing
+    """
+    if hasattr(os, 'copy_file_range'):
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        remaining = os.fstat(src_fd).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    # Kernel stopped early (e.g. special files); finish below
+                    break
+                remaining -= copied
+            else:
+                return
+        except OSError as e:
+            if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                raise
+    
+    # Both file offsets were advanced by whatever was copied so far, so this
+    # copies the rest (or everything, when the syscall was not used)
+    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
 
 class FileHandler:
     """Handle file operations"""
@@ -25,6 +66,7 @@ class FileHandler:
     def __init__(self):
         self.upload_dir = settings.UPLOAD_DIR
         self.output_dir = settings.OUTPUT_DIR
+        # Read size for chunked reads; also the upload copy buffer when >= 1 MiB
         self.chunk_size = settings.CHUNK_SIZE
         
         # Ensure directories exist
@@ -62,16 +104,11 @@ class FileHandler:
         file_path = destination / unique_filename
         
         # Save file
-        try:
-            with open(file_path, 'wb') as f:
-                shutil.copyfileobj(file_data, f)
-            
-            logger.info(f"File saved: {file_path}")
-            return file_path
-            
-        except Exception as e:
-            logger.error(f"Failed to save file: {e}")
-            raise
+        with open(file_path, 'wb') as f:
+            shutil.copyfileobj(file_data, f, max(self.chunk_size, COPY_BUFFER_SIZE))
+        
+        logger.info(f"File saved: {file_path}")
+        return file_path
     
     async def save_upload_async(
         self,
@@ -100,16 +137,13 @@ class FileHandler:
         unique_filename = generate_unique_filename(safe_filename, destination)
         file_path = destination / unique_filename
         
-        try:
-            async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(file_data)
-            
-            logger.info(f"File saved (async): {file_path}")
-            return file_path
-            
-        except Exception as e:
-            logger.error(f"Failed to save file (async): {e}")
-            raise
+        # A single whole-buffer write; one executor hop is cheaper than aiofiles
+        await asyncio.get_running_loop().run_in_executor(
+            None, file_path.write_bytes, file_data
+        )
+        
+        logger.info(f"File saved (async): {file_path}")
+        return file_path
     
     def copy_file(self, source: str | Path, destination: str | Path) -> Path:
         """
@@ -132,14 +166,20 @@ class FileHandler:
         # Ensure destination directory exists
         ensure_directory(destination.parent)
         
+        # Opening the destination for writing would truncate the source
         try:
-            shutil.copy2(source, destination)
-            logger.info(f"File copied: {source} -> {destination}")
-            return destination
-            
-        except Exception as e:
-            logger.error(f"Failed to copy file: {e}")
-            raise
+            same_file = os.path.samefile(source, destination)
+        except OSError:
+            same_file = False
+        if same_file:
+            raise shutil.SameFileError(f"{source} and {destination} are the same file")
+        
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            _copy_contents(src, dst)
+        shutil.copystat(source, destination)
+        
+        logger.info(f"File copied: {source} -> {destination}")
+        return destination
     
     def move_file(self, source: str | Path, destination: str | Path) -> Path:
         """
@@ -160,14 +200,10 @@ class FileHandler:
         
         ensure_directory(destination.parent)
         
-        try:
-            shutil.move(str(source), str(destination))
-            logger.info(f"File moved: {source} -> {destination}")
-            return destination
-            
-        except Exception as e:
-            logger.error(f"Failed to move file: {e}")
-            raise
+        shutil.move(str(source), str(destination))
+        
+        logger.info(f"File moved: {source} -> {destination}")
+        return destination
     
     def delete_file(self, file_path: str | Path) -> bool:
         """
@@ -181,16 +217,18 @@ class FileHandler:
         """
         file_path = Path(file_path)
         
-        try:
-            if file_path.exists() and file_path.is_file():
-                file_path.unlink()
-                logger.info(f"File deleted: {file_path}")
-                return True
+        # is_file() is False for missing paths, so one stat covers both checks
+        if not file_path.is_file():
             return False
-            
-        except Exception as e:
+        
+        try:
+            file_path.unlink(missing_ok=True)
+        except OSError as e:
             logger.error(f"Failed to delete file: {e}")
             return False
+        
+        logger.debug(f"File deleted: {file_path}")
+        return True
     
     def delete_files(self, file_paths: List[str | Path]) -> int:
         """
@@ -202,10 +240,8 @@ class FileHandler:
         Returns:
             Number of files deleted
         """
-        count = 0
-        for file_path in file_paths:
-            if self.delete_file(file_path):
-                count += 1
+        delete_file = self.delete_file
+        count = sum(1 for file_path in file_paths if delete_file(file_path))
         
         logger.info(f"Deleted {count}/{len(file_paths)} files")
         return count
@@ -219,16 +255,23 @@ class FileHandler:
         """
         import time
         
-        current_time = time.time()
-        max_age_seconds = max_age_hours * 3600
+        cutoff = time.time() - max_age_hours * 3600
         
+        # DirEntry caches the file type and stat result, so each entry
+        # costs at most one stat syscall before the unlink
         count = 0
-        for file_path in self.upload_dir.glob('*'):
-            if file_path.is_file():
-                file_age = current_time - file_path.stat().st_mtime
-                if file_age > max_age_seconds:
-                    if self.delete_file(file_path):
-                        count += 1
+        with os.scandir(self.upload_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except OSError as e:
+                    logger.debug(f"Failed to delete {entry.path}: {e}")
+                    continue
+                count += 1
         
         logger.info(f"Cleaned up {count} temporary files")
         return count
@@ -280,11 +323,7 @@ class FileHandler:
             chunk_size = self.chunk_size
         
         with open(file_path, 'rb') as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                yield chunk
+            yield from iter(partial(f.read, chunk_size), b'')
     
     async def read_file_chunks_async(
         self,
@@ -305,10 +344,8 @@ class FileHandler:
             chunk_size = self.chunk_size
         
         async with aiofiles.open(file_path, 'rb') as f:
-            while True:
-                chunk = await f.read(chunk_size)
-                if not chunk:
-                    break
+            read = f.read
+            while chunk := await read(chunk_size):
                 yield chunk
     
     def get_file_info(self, file_path: str | Path) -> dict:
@@ -7,14 +7,44 @@ import os
 import re
 import uuid
 import hashlib
+import secrets
+import shutil
+import threading
+import zipfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 import json
 from utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Directories already created by ensure_directory in this process
+_KNOWN_DIRS: set[str] = set()
+
+# Buffer size for streaming file copies (ZIP entries, uploads)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Read size for generate_file_hash when hashlib.file_digest is unavailable
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# LRU cache for generate_file_hash, keyed on (path, mtime_ns, size, algorithm)
+HASH_CACHE_MAX_ENTRIES = 1024
+_hash_cache: OrderedDict[tuple, str] = OrderedDict()
+_hash_cache_lock = threading.Lock()
+
+# Built once for sanitize_filename: drop invalid characters, spaces -> '_'
+_SANITIZE_TABLE = str.maketrans({c: None for c in '<>:"/\\|?*'} | {' ': '_'})
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+
 
 def get_file_extension(file_path: str | Path) -> str:
     """
@@ -26,7 +56,13 @@ def get_file_extension(file_path: str | Path) -> str:
     Returns:
         File extension (lowercase, without dot)
     """
-    return Path(file_path).suffix.lower().replace('.', '')
+    # Same result as Path(file_path).suffix without building a Path: the
+    # last dot must fall inside the final component and not lead it
+    path = os.fspath(file_path)
+    dot = path.rfind('.')
+    if dot <= max(path.rfind('/'), path.rfind('\\')) + 1 or dot == len(path) - 1:
+        return ''
+    return path[dot + 1:].lower()
 
 
 def get_file_size(file_path: str | Path) -> int:
@@ -52,11 +88,12 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    
+    # Each unit is 2**10 of the previous one, so the bit length picks it
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
 
 
 def sanitize_filename(filename: str) -> str:
@@ -69,17 +106,20 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-    
-    # Replace spaces with underscores
-    filename = filename.replace(' ', '_')
+    # Remove invalid characters and replace spaces with underscores
+    filename = filename.translate(_SANITIZE_TABLE)
     
     # Remove multiple underscores
-    filename = re.sub(r'_+', '_', filename)
+    if '__' in filename:
+        filename = _MULTI_UNDERSCORE_RE.sub('_', filename)
     
     # Limit length
-    name, ext = os.path.splitext(filename)
+    # Same split as os.path.splitext: leading dots belong to the name
+    name, dot, ext = filename.rpartition('.')
+    if not name.strip('.'):
+        name, ext = filename, ''
+    else:
+        ext = dot + ext
     if len(name) > 200:
         name = name[:200]
     
@@ -90,16 +130,23 @@ def generate_unique_filename(
     original_filename: str,
     output_dir: Optional[str | Path] = None,
     prefix: str = "",
-    suffix: str = ""
+    suffix: str = "",
+    check_collisions: bool = True
 ) -> str:
     """
     Generate unique filename to avoid conflicts
     
+    By default the directory is listed once and a numeric counter is
+    appended until the name is free. With ``check_collisions=False`` a short
+    random token is appended instead, which avoids touching the filesystem
+    but makes the name unpredictable.
+    
     Args:
         original_filename: Original filename
         output_dir: Output directory to check for conflicts
         prefix: Prefix to add
         suffix: Suffix to add (before extension)
+        check_collisions: Check existing files (False: append a random token)
         
     Returns:
         Unique filename
@@ -118,22 +165,46 @@ def generate_unique_filename(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return f"{name}_{timestamp}{ext}"
     
-    # Check for conflicts in output directory
-    output_dir = Path(output_dir)
+    if not check_collisions:
+        return f"{name}_{uuid.uuid4().hex[:8]}{ext}"
+    
+    # Check for conflicts against a single listing of the output directory
+    try:
+        with os.scandir(output_dir) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        existing = set()
+    
     base_name = name
     counter = 1
     
-    while (output_dir / f"{name}{ext}").exists():
+    while f"{name}{ext}" in existing:
         name = f"{base_name}_{counter}"
         counter += 1
     
     return f"{name}{ext}"
 
 
-def generate_file_hash(file_path: str | Path, algorithm: str = 'md5') -> str:
+def _hash_file(file_path: Path, algorithm: str) -> str:
+    """Hash the full content of a file"""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+        
+        # Python < 3.11
+        hash_func = hashlib.new(algorithm)
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            hash_func.update(chunk)
+        return hash_func.hexdigest()
+
+
+def generate_file_hash(file_path: str | Path, algorithm: str = 'sha256') -> str:
     """
     Generate hash of file content
     
+    Results are cached by (path, mtime, size, algorithm), so an unchanged
+    file is only read once; modifying the file invalidates its entry.
+    
     Args:
         file_path: Path to file
         algorithm: Hash algorithm (md5, sha1, sha256)
@@ -141,18 +212,35 @@ def generate_file_hash(file_path: str | Path, algorithm: str = 'md5') -> str:
     Returns:
         File hash
     """
-    hash_func = hashlib.new(algorithm)
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size, algorithm)
     
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            hash_func.update(chunk)
+    with _hash_cache_lock:
+        digest = _hash_cache.get(key)
+        if digest is not None:
+            _hash_cache.move_to_end(key)
+            return digest
+    
+    digest = _hash_file(path, algorithm)
+    
+    with _hash_cache_lock:
+        _hash_cache[key] = digest
+        if len(_hash_cache) > HASH_CACHE_MAX_ENTRIES:
+            _hash_cache.popitem(last=False)
     
-    return hash_func.hexdigest()
+    return digest
+
+
+def clear_file_hash_cache():
+    """Drop all hashes cached by generate_file_hash"""
+    with _hash_cache_lock:
+        _hash_cache.clear()
 
 
 def create_temp_filename(extension: str = '') -> str:
     """
-    Create temporary filename with UUID
+    Create temporary filename with a random 128-bit hex token
     
     Args:
         extension: File extension (with or without dot)
@@ -163,7 +251,7 @@ def create_temp_filename(extension: str = '') -> str:
     if extension and not extension.startswith('.'):
         extension = f'.{extension}'
     
-    return f"temp_{uuid.uuid4().hex}{extension}"
+    return f"temp_{secrets.token_hex(16)}{extension}"
 
 
 def ensure_directory(directory: str | Path) -> Path:
@@ -177,7 +265,12 @@ def ensure_directory(directory: str | Path) -> Path:
         Path object
     """
     directory = Path(directory)
+    key = str(directory)
+    if key in _KNOWN_DIRS:
+        return directory
+    
     directory.mkdir(parents=True, exist_ok=True)
+    _KNOWN_DIRS.add(key)
     return directory
 
 
@@ -201,14 +294,18 @@ def clean_directory(directory: str | Path, pattern: str = '*', recursive: bool =
         files = directory.glob(pattern)
     
     count = 0
+    failed = []
     for file in files:
         if file.is_file():
             try:
                 file.unlink()
                 count += 1
             except Exception as e:
-                logger.warning(f"Failed to delete {file}: {e}")
+                failed.append(f"{file}: {e}")
     
+    # One record for the whole run rather than one per file
+    if failed:
+        logger.warning(f"Failed to delete {len(failed)} files from {directory}: " + "; ".join(failed))
     logger.info(f"Cleaned {count} files from {directory}")
 
 
@@ -222,8 +319,10 @@ def load_json_file(file_path: str | Path) -> Dict[Any, Any]:
     Returns:
         Parsed JSON data
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    data = Path(file_path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def save_json_file(data: Dict[Any, Any], file_path: str | Path, indent: int = 2):
@@ -235,8 +334,35 @@ def save_json_file(data: Dict[Any, Any], file_path: str | Path, indent: int = 2)
         file_path: Path to JSON file
         indent: JSON indentation
     """
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    if orjson is not None and indent == 2:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+    
+    Path(file_path).write_bytes(payload)
+
+
+def add_file_to_zip(zip_file: zipfile.ZipFile, file_path: str | Path, arcname: str):
+    """
+    Copy a file into an open ZIP archive using large reads
+    
+    Same entry as ZipFile.write (mtime, permissions, the archive's compression
+    settings), but streamed in COPY_BUFFER_SIZE chunks instead of 8 KiB ones.
+    
+    Args:
+        zip_file: ZIP archive opened for writing
+        file_path: Path to file to add
+        arcname: Name of the entry inside the archive
+    """
+    info = zipfile.ZipInfo.from_file(file_path, arcname)
+    info.compress_type = zip_file.compression
+    info._compresslevel = zip_file.compresslevel  # what ZipFile.write sets too
+    
+    # Writing through ZipFile.open() needs Zip64 requested up front for large entries
+    force_zip64 = info.file_size > zipfile.ZIP64_LIMIT
+    
+    with open(file_path, 'rb') as src, zip_file.open(info, 'w', force_zip64=force_zip64) as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
 
 
 def get_mime_type(file_path: str | Path) -> Optional[str]:
@@ -309,12 +435,21 @@ def parse_file_path(file_path: str | Path) -> Dict[str, str]:
     """
     path = Path(file_path)
     
+    # One stat covers both the existence check and the size
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = 0
+        size_formatted = '0 B'
+    else:
+        size_formatted = format_file_size(size)
+    
     return {
         'full_path': str(path.absolute()),
         'directory': str(path.parent),
         'filename': path.name,
         'stem': path.stem,
-        'extension': path.suffix.lower().replace('.', ''),
-        'size': get_file_size(path) if path.exists() else 0,
-        'size_formatted': format_file_size(get_file_size(path)) if path.exists() else '0 B'
+        'extension': get_file_extension(path.name),
+        'size': size,
+        'size_formatted': size_formatted
     }
@@ -10,6 +10,11 @@ from typing import Optional
 from config.settings import settings
 
 
+def _conversion_filter(record) -> bool:
+    """Route only records bound with conversion=True to the conversion log"""
+    return record["extra"].get("conversion") is True
+
+
 def setup_logger(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -76,7 +81,7 @@ def setup_logger(
         retention=retention,
         compression=compression,
         enqueue=True,
-        filter=lambda record: "conversion" in record["extra"]
+        filter=_conversion_filter
     )
     
     logger.info(f"Logger initialized - Level: {log_level}")
@@ -99,37 +104,41 @@ def get_logger(name: str = __name__):
 setup_logger(log_level=settings.LOG_LEVEL)
 
 
+# Bound once and shared by the conversion logging helpers below
+_conversion_logger = logger.bind(conversion=True)
+
+
 # Convenience functions for conversion logging
 def log_conversion_start(input_file: str, output_format: str):
     """Log conversion start"""
-    logger.bind(conversion=True).info(
+    _conversion_logger.info(
         f"Starting conversion: {input_file} -> {output_format}"
     )
 
 
 def log_conversion_success(input_file: str, output_file: str, duration: float):
     """Log successful conversion"""
-    logger.bind(conversion=True).success(
+    _conversion_logger.success(
         f"Conversion completed: {input_file} -> {output_file} ({duration:.2f}s)"
     )
 
 
 def log_conversion_error(input_file: str, error: str):
     """Log conversion error"""
-    logger.bind(conversion=True).error(
+    _conversion_logger.error(
         f"Conversion failed: {input_file} - Error: {error}"
     )
 
 
 def log_batch_start(total_files: int):
     """Log batch conversion start"""
-    logger.bind(conversion=True).info(
+    _conversion_logger.info(
         f"Starting batch conversion: {total_files} files"
     )
 
 
 def log_batch_complete(successful: int, failed: int, duration: float):
     """Log batch conversion completion"""
-    logger.bind(conversion=True).info(
+    _conversion_logger.info(
         f"Batch conversion completed: {successful} successful, {failed} failed ({duration:.2f}s)"
     )
@@ -3,22 +3,30 @@ Progress tracking utilities
 Track conversion progress for CLI and API
 """
 
-from typing import Optional, Callable
+import itertools
+import sys
+import threading
+import time
+from typing import Optional, Callable, Dict, List, Tuple
 from tqdm import tqdm
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TaskProgressColumn,
-    TimeRemainingColumn,
-    TimeElapsedColumn
-)
-from rich.console import Console
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
-console = Console()
+
+# Rich is imported on first use; most callers (API, Streamlit, tqdm bars) never need it
+_console = None
+
+
+def _get_console():
+    """Get the shared Rich console, importing Rich on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+# Minimum seconds between callback notifications (20 Hz)
+DEFAULT_REFRESH_INTERVAL = 0.05
 
 
 class ProgressTracker:
@@ -29,6 +37,8 @@ class ProgressTracker:
         self.current = 0
         self.description = description
         self.callbacks = []
+        self._min_interval = DEFAULT_REFRESH_INTERVAL
+        self._last_notify = 0.0
     
     def update(self, amount: int = 1):
         """Update progress"""
@@ -44,8 +54,22 @@ class ProgressTracker:
         """Add progress callback"""
         self.callbacks.append(callback)
     
+    def set_refresh_rate(self, hz: float):
+        """
+        Set the maximum callback rate
+        
+        Args:
+            hz: Notifications per second; 0 notifies on every update
+        """
+        self._min_interval = 1.0 / hz if hz > 0 else 0.0
+    
     def _notify_callbacks(self):
-        """Notify all callbacks"""
+        """Notify all callbacks, at most once per refresh interval until complete"""
+        now = time.monotonic()
+        if now - self._last_notify < self._min_interval and not self.is_complete():
+            return
+        self._last_notify = now
+        
         for callback in self.callbacks:
             try:
                 callback(self.current, self.total)
@@ -63,6 +87,33 @@ class ProgressTracker:
         return self.current >= self.total
 
 
+class _SilentBar:
+    """
+    Stand-in for tqdm when stderr is not a terminal
+    
+    Tracks the count and logs roughly every 1% instead of rendering a bar.
+    """
+    
+    def __init__(self, total: int, description: str = "Processing"):
+        self.total = total
+        self.n = 0
+        self.description = description
+        self._log_every = max(1, total // 100)
+        self._next_log = self._log_every
+    
+    def update(self, amount: int = 1):
+        self.n += amount
+        if self.n >= self._next_log:
+            self._next_log = self.n + self._log_every
+            logger.info(f"{self.description}: {self.n}/{self.total}")
+    
+    def set_description(self, description: str):
+        self.description = description
+    
+    def close(self):
+        pass
+
+
 class CLIProgressBar:
     """CLI progress bar using tqdm"""
     
@@ -72,11 +123,19 @@ class CLIProgressBar:
         description: str = "Processing",
         unit: str = "file"
     ):
+        # Rendering a bar into a redirected stream is pure overhead; tqdm
+        # writes to stderr, so that is the stream that matters
+        if not sys.stderr.isatty():
+            self.pbar = _SilentBar(total, description)
+            return
+        
         self.pbar = tqdm(
             total=total,
             desc=description,
             unit=unit,
-            bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]'
+            bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]',
+            mininterval=0.1,
+            miniters=max(1, total // 1000)
         )
     
     def update(self, amount: int = 1):
@@ -101,7 +160,22 @@ class CLIProgressBar:
 class RichProgressBar:
     """Rich progress bar with multiple columns"""
     
-    def __init__(self):
+    def __init__(self, refresh_per_second: float = 10):
+        """
+        Args:
+            refresh_per_second: Render rate of the background refresh thread
+        """
+        from rich.progress import (
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            BarColumn,
+            TaskProgressColumn,
+            TimeRemainingColumn,
+            TimeElapsedColumn
+        )
+        
+        # Rendering happens on Rich's refresh thread; update() only bumps counters
         self.progress = Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
@@ -109,7 +183,9 @@ class RichProgressBar:
             TaskProgressColumn(),
             TimeElapsedColumn(),
             TimeRemainingColumn(),
-            console=console
+            console=_get_console(),
+            auto_refresh=True,
+            refresh_per_second=refresh_per_second
         )
         self.tasks = {}
     
@@ -130,7 +206,7 @@ class RichProgressBar:
     def update(self, name: str, advance: int = 1):
         """Update task progress"""
         if name in self.tasks:
-            self.progress.update(self.tasks[name], advance=advance)
+            self.progress.advance(self.tasks[name], advance)
     
     def set_description(self, name: str, description: str):
         """Update task description"""
@@ -161,11 +237,19 @@ class BatchProgressTracker:
     
     def __init__(self, total_files: int):
         self.total_files = total_files
-        self.completed = 0
-        self.successful = 0
-        self.failed = 0
         self.current_file = ""
         self.callbacks = []
+        self._min_interval = DEFAULT_REFRESH_INTERVAL
+        self._last_notify = 0.0
+        
+        # Per-thread [completed, successful, failed]. Each list is only
+        # written by its own thread, so complete_file takes no lock; the
+        # totals are folded from these whenever they are read.
+        self._lock = threading.Lock()
+        self._staged: Dict[int, List[int]] = {}
+        # next() on itertools.count is atomic, so exactly one caller sees
+        # the last file complete
+        self._completions = itertools.count(1)
     
     def start_file(self, filename: str):
         """Mark file conversion start"""
@@ -173,49 +257,109 @@ class BatchProgressTracker:
         logger.info(f"Processing: {filename}")
     
     def complete_file(self, success: bool = True):
-        """Mark file conversion complete"""
-        self.completed += 1
-        if success:
-            self.successful += 1
-        else:
-            self.failed += 1
+        """Mark file conversion complete (safe to call from worker threads)"""
+        counts = self._staged.get(threading.get_ident()) or self._register_thread()
+        counts[0] += 1
+        counts[1 if success else 2] += 1
         
-        self._notify_callbacks()
+        is_last = next(self._completions) >= self.total_files
+        self._notify_callbacks(force=is_last)
+    
+    def _register_thread(self) -> List[int]:
+        """Create the staging counters for the calling thread"""
+        with self._lock:
+            return self._staged.setdefault(threading.get_ident(), [0, 0, 0])
+    
+    def _fold_staged(self) -> Tuple[int, int, int]:
+        """Fold the per-thread counters into (completed, successful, failed)"""
+        with self._lock:
+            staged = list(self._staged.values())
+        
+        return (
+            sum(counts[0] for counts in staged),
+            sum(counts[1] for counts in staged),
+            sum(counts[2] for counts in staged)
+        )
+    
+    @property
+    def completed(self) -> int:
+        """Number of files completed so far"""
+        return self._fold_staged()[0]
+    
+    @property
+    def successful(self) -> int:
+        """Number of files converted successfully so far"""
+        return self._fold_staged()[1]
+    
+    @property
+    def failed(self) -> int:
+        """Number of files that failed so far"""
+        return self._fold_staged()[2]
     
     def add_callback(self, callback: Callable):
         """Add progress callback"""
         self.callbacks.append(callback)
     
-    def _notify_callbacks(self):
-        """Notify all callbacks"""
+    def set_refresh_rate(self, hz: float):
+        """
+        Set the maximum callback rate
+        
+        Args:
+            hz: Notifications per second; 0 notifies on every file
+        """
+        self._min_interval = 1.0 / hz if hz > 0 else 0.0
+    
+    def _notify_callbacks(self, force: bool = False):
+        """Notify all callbacks, at most once per refresh interval unless forced"""
+        now = time.monotonic()
+        if not force and now - self._last_notify < self._min_interval:
+            return
+        self._last_notify = now
+        
+        status = self.get_status()
         for callback in self.callbacks:
             try:
-                callback(self.get_status())
+                callback(status)
             except Exception as e:
                 logger.error(f"Batch progress callback error: {e}")
     
     def get_status(self) -> dict:
         """Get current status"""
+        completed, successful, failed = self._fold_staged()
         return {
             'total': self.total_files,
-            'completed': self.completed,
-            'successful': self.successful,
-            'failed': self.failed,
-            'remaining': self.total_files - self.completed,
+            'completed': completed,
+            'successful': successful,
+            'failed': failed,
+            'remaining': self.total_files - completed,
             'current_file': self.current_file,
-            'percentage': (self.completed / self.total_files * 100) if self.total_files > 0 else 0
+            'percentage': (completed / self.total_files * 100) if self.total_files > 0 else 0
         }
     
     def print_summary(self):
         """Print conversion summary"""
-        console.print("\n[bold]Conversion Summary:[/bold]")
-        console.print(f"Total files: {self.total_files}")
-        console.print(f"[green]Successful: {self.successful}[/green]")
-        console.print(f"[red]Failed: {self.failed}[/red]")
+        _, successful, failed = self._fold_staged()
         
+        lines = [
+            "",
+            "Conversion Summary:",
+            f"Total files: {self.total_files}",
+            f"Successful: {successful}",
+            f"Failed: {failed}"
+        ]
         if self.total_files > 0:
-            success_rate = (self.successful / self.total_files) * 100
-            console.print(f"Success rate: {success_rate:.1f}%")
+            success_rate = (successful / self.total_files) * 100
+            lines.append(f"Success rate: {success_rate:.1f}%")
+        
+        # Redirected output gets no styling anyway, so skip Rich entirely
+        if not sys.stdout.isatty():
+            print("\n".join(lines))
+            return
+        
+        lines[1] = f"[bold]{lines[1]}[/bold]"
+        lines[3] = f"[green]{lines[3]}[/green]"
+        lines[4] = f"[red]{lines[4]}[/red]"
+        _get_console().print("\n".join(lines))
 
 
 def create_progress_bar(
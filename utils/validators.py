@@ -4,15 +4,41 @@ Validates file types, sizes, and content
 """
 
 import os
+import stat
+import codecs
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, List
-import chardet
 from config.settings import settings
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Marker in FileValidator._MAGIC for ZIP-based formats (DOCX, XLSX)
+_ZIP = '_zip'
+
+# Threads used by FileValidator.validate_batch
+VALIDATION_WORKERS = 16
+
+# Byte order marks checked by validate_encoding, mapped to codecs that strip
+# the BOM when decoding; UTF-32 first since its little-endian BOM starts with
+# the UTF-16 one
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+@lru_cache(maxsize=None)
+def _conversions_for(input_format: str, formats: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Output formats reachable from input_format, in configured order"""
+    return tuple(fmt for fmt in formats if fmt != input_format)
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
@@ -22,26 +48,43 @@ class ValidationError(Exception):
 class FileValidator:
     """File validation class"""
     
-    # MIME type mappings
+    # MIME type mappings (frozensets for O(1) membership checks)
     MIME_TYPES = {
-        'pdf': ['application/pdf'],
-        'docx': [
+        'pdf': frozenset({'application/pdf'}),
+        'docx': frozenset({
             'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
             'application/msword'
-        ],
-        'xlsx': [
+        }),
+        'xlsx': frozenset({
             'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             'application/vnd.ms-excel'
-        ],
-        'csv': ['text/csv', 'text/plain'],
-        'json': ['application/json', 'text/plain'],
-        'txt': ['text/plain']
+        }),
+        'csv': frozenset({'text/csv', 'text/plain'}),
+        'json': frozenset({'application/json', 'text/plain'}),
+        'txt': frozenset({'text/plain'})
+    }
+    
+    # Extensions whose MIME type is fully determined by mimetypes
+    UNAMBIGUOUS_EXT = frozenset(ext for ext, mimes in MIME_TYPES.items() if len(mimes) == 1)
+    
+    # Leading bytes -> MIME type, for files mimetypes cannot classify
+    _MAGIC = (
+        (b'%PDF', 'application/pdf'),
+        (b'PK\x03\x04', _ZIP),
+    )
+    
+    # ZIP containers are told apart by extension
+    _ZIP_MIME_TYPES = {
+        'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
     }
     
     def __init__(self):
         self.max_size = settings.MAX_UPLOAD_SIZE
-        self.allowed_extensions = settings.ALLOWED_EXTENSIONS
-        self.supported_formats = settings.SUPPORTED_FORMATS
+        self.allowed_extensions = frozenset(ext.lower() for ext in settings.ALLOWED_EXTENSIONS)
+        # Ordered copy for listing conversions, set for lookups
+        self._format_order = tuple(fmt.lower() for fmt in settings.SUPPORTED_FORMATS)
+        self.supported_formats = frozenset(self._format_order)
     
     def validate_file(
         self, 
@@ -60,72 +103,151 @@ class FileValidator:
         """
         file_path = Path(file_path)
         
-        # Check if file exists
-        if not file_path.exists():
+        # One stat answers existence, type and size
+        try:
+            file_stat = file_path.stat()
+        except OSError:
             return False, f"File not found: {file_path}"
         
         # Check if it's a file
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             return False, f"Not a file: {file_path}"
         
+        return self._validate_regular_file(file_path, file_stat.st_size, check_content)
+    
+    def validate_entry(
+        self,
+        entry: os.DirEntry,
+        check_content: bool = True
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Validate a file found with os.scandir
+        
+        Reuses the file type and stat result cached on the DirEntry, so no
+        extra stat calls are made before the content checks.
+        
+        Args:
+            entry: Directory entry from os.scandir
+            check_content: Whether to validate file content
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if not entry.is_file():
+            return False, f"Not a file: {entry.path}"
+        
+        return self._validate_regular_file(Path(entry.path), entry.stat().st_size, check_content)
+    
+    def _validate_regular_file(
+        self,
+        file_path: Path,
+        file_size: int,
+        check_content: bool
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Run the size, extension and content checks on an existing file
+        
+        Args:
+            file_path: Path to file
+            file_size: File size in bytes
+            check_content: Whether to validate file content
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
         # Check file size
-        file_size = file_path.stat().st_size
         if file_size > self.max_size:
             max_mb = self.max_size / (1024 * 1024)
             actual_mb = file_size / (1024 * 1024)
             return False, f"File too large: {actual_mb:.2f}MB (max: {max_mb:.2f}MB)"
         
         # Check file extension
-        extension = file_path.suffix.lower()
-        if extension not in self.allowed_extensions:
-            return False, f"Unsupported file extension: {extension}"
+        suffix = file_path.suffix.lower()
+        if suffix not in self.allowed_extensions:
+            return False, f"Unsupported file extension: {suffix}"
         
         # Check MIME type if content validation is enabled
         if check_content:
-            mime_valid, mime_error = self._validate_mime_type(file_path)
+            mime_valid, mime_error = self._validate_mime_type(file_path, suffix[1:])
             if not mime_valid:
                 return False, mime_error
         
         logger.info(f"File validation passed: {file_path}")
         return True, None
     
-    def _validate_mime_type(self, file_path: Path) -> Tuple[bool, Optional[str]]:
+    def validate_batch(
+        self,
+        file_paths: List[str | Path],
+        check_content: bool = True,
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Validate many files, overlapping their filesystem calls
+        
+        The stat/open/read calls behind each validation release the GIL, so
+        a thread pool keeps several files' I/O in flight at once. A single
+        file is validated inline.
+        
+        Args:
+            file_paths: Paths to validate
+            check_content: Whether to validate file content
+            max_workers: Thread count (default: VALIDATION_WORKERS)
+            
+        Returns:
+            (is_valid, error_message) tuples in the same order as file_paths
+        """
+        if len(file_paths) <= 1:
+            return [self.validate_file(path, check_content) for path in file_paths]
+        
+        workers = min(max_workers or VALIDATION_WORKERS, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda path: self.validate_file(path, check_content),
+                file_paths
+            ))
+    
+    def _validate_mime_type(
+        self,
+        file_path: Path,
+        extension: str
+    ) -> Tuple[bool, Optional[str]]:
         """
         Validate file MIME type
         
         Args:
             file_path: Path to file
+            extension: Lower-case extension without the dot
             
         Returns:
             Tuple of (is_valid, error_message)
         """
+        # mimetypes maps these extensions to exactly the one allowed type,
+        # so guessing would only confirm it
+        if extension in self.UNAMBIGUOUS_EXT:
+            return True, None
+        
         try:
             # Get MIME type
-            mime_type, _ = mimetypes.guess_type(str(file_path))
+            mime_type, _ = mimetypes.guess_type(file_path)
             
             if mime_type is None:
                 # Try to detect from content
                 with open(file_path, 'rb') as f:
                     header = f.read(1024)
                     
-                # Check for PDF
-                if header.startswith(b'%PDF'):
-                    mime_type = 'application/pdf'
-                # Check for ZIP-based formats (DOCX, XLSX)
-                elif header.startswith(b'PK\x03\x04'):
-                    # Could be DOCX or XLSX
-                    extension = file_path.suffix.lower()
-                    if extension == '.docx':
-                        mime_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-                    elif extension == '.xlsx':
-                        mime_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+                for prefix, magic_mime in self._MAGIC:
+                    if header.startswith(prefix):
+                        if magic_mime == _ZIP:
+                            # Could be DOCX or XLSX
+                            magic_mime = self._ZIP_MIME_TYPES.get(extension)
+                        mime_type = magic_mime
+                        break
             
             if mime_type is None:
                 return True, None  # Allow if we can't determine
             
             # Check if MIME type is allowed for this extension
-            extension = file_path.suffix.lower().replace('.', '')
-            allowed_mimes = self.MIME_TYPES.get(extension, [])
+            allowed_mimes = self.MIME_TYPES.get(extension)
             
             if allowed_mimes and mime_type not in allowed_mimes:
                 return False, f"Invalid file type: {mime_type} for .{extension}"
@@ -149,8 +271,28 @@ class FileValidator:
         try:
             with open(file_path, 'rb') as f:
                 raw_data = f.read(10000)  # Read first 10KB
-                result = chardet.detect(raw_data)
-                return result['encoding'], result['confidence']
+            
+            # Byte order marks are definitive
+            for bom, encoding in _BOMS:
+                if raw_data.startswith(bom):
+                    return encoding, 1.0
+            
+            # Most text is UTF-8 (or ASCII); a strict decode is far cheaper
+            # than statistical detection. Incremental so a multi-byte
+            # character cut off at the 10KB boundary is not an error, but
+            # only when the sample really was cut off.
+            try:
+                codecs.getincrementaldecoder('utf-8')().decode(
+                    raw_data, final=len(raw_data) < 10000
+                )
+                return 'utf-8', 1.0
+            except UnicodeDecodeError:
+                pass
+            
+            import chardet
+            
+            result = chardet.detect(raw_data)
+            return result['encoding'], result['confidence']
         except Exception as e:
             logger.error(f"Encoding detection failed: {e}")
             return 'utf-8', 0.0
@@ -181,7 +323,19 @@ class FileValidator:
             return []
         
         # All formats can convert to all other formats
-        return [fmt for fmt in self.supported_formats if fmt != input_format.lower()]
+        return list(_conversions_for(input_format.lower(), self._format_order))
+
+
+# Shared instance for the convenience functions, created on first use
+_default_validator: Optional[FileValidator] = None
+
+
+def _get_default_validator() -> FileValidator:
+    """Get the shared FileValidator, creating it on first use"""
+    global _default_validator
+    if _default_validator is None:
+        _default_validator = FileValidator()
+    return _default_validator
 
 
 # Convenience function
@@ -196,8 +350,7 @@ def validate_file(file_path: str | Path, check_content: bool = True) -> Tuple[bo
     Returns:
         Tuple of (is_valid, error_message)
     """
-    validator = FileValidator()
-    return validator.validate_file(file_path, check_content)
+    return _get_default_validator().validate_file(file_path, check_content)
 
 
 def validate_conversion(input_format: str, output_format: str) -> Tuple[bool, Optional[str]]:
@@ -211,7 +364,7 @@ def validate_conversion(input_format: str, output_format: str) -> Tuple[bool, Op
     Returns:
         Tuple of (is_valid, error_message)
     """
-    validator = FileValidator()
+    validator = _get_default_validator()
     
     if not validator.is_supported_format(input_format):
         return False, f"Unsupported input format: {input_format}"